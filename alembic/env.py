@@ -11,7 +11,7 @@ from alembic import context
 
 # Import your models here to ensure they are registered with SQLAlchemy
 from collaboration_bridge.core.database import Base
-from collaboration_bridge.core.config import settings
+from collaboration_bridge.core.config import get_settings
 # Import all models to ensure they are registered
 from collaboration_bridge.models import *
 
@@ -36,7 +36,7 @@ target_metadata = Base.metadata
 
 def get_url():
     """Get database URL from settings."""
-    return settings.async_database_url
+    return get_settings().async_database_url
 
 
 def run_migrations_offline() -> None:
@@ -1,9 +1,12 @@
+import time
+
+import jwt
+from anyio import to_thread
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from collaboration_bridge.core.config import settings
+from collaboration_bridge.core.config import get_settings
 from collaboration_bridge.core.database import AsyncSessionLocal
 from collaboration_bridge.crud import user as user_crud
 from collaboration_bridge.models.user import User
@@ -11,9 +14,52 @@ from collaboration_bridge.schemas import user as user_schema
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/token")
 
+# Signing key and algorithm list resolved once instead of on every encode/decode
+JWT_SIGNING_KEY = get_settings().SECRET_KEY.encode()
+JWT_ALGORITHMS = [get_settings().ALGORITHM]
+
+# Verified token subjects keyed by the raw token, so a client presenting the same
+# bearer token across requests skips signature verification. An entry is only
+# honoured until the token's own `exp`.
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: dict[str, tuple[str, float]] = {}
+
+
+def _verify_token(token: str) -> tuple[str | None, float | None]:
+    """Verify the token's signature and return its `sub` and `exp` claims."""
+    payload = jwt.decode(token, JWT_SIGNING_KEY, algorithms=JWT_ALGORITHMS)
+    return payload.get("sub"), payload.get("exp")
+
+
+async def _decode_token_subject(token: str) -> str | None:
+    """Return the token's `sub` claim, verifying the signature on a cache miss."""
+    cached = _token_cache.get(token)
+    if cached is not None:
+        email, expires_at = cached
+        if time.time() < expires_at:
+            return email
+        _token_cache.pop(token, None)
+
+    if get_settings().JWT_OFFLOAD_VERIFY:
+        # Keep slow (asymmetric) signature checks off the event loop
+        subject, exp = await to_thread.run_sync(_verify_token, token)
+    else:
+        subject, exp = _verify_token(token)
+    if subject is not None and exp is not None:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _token_cache.pop(next(iter(_token_cache)), None)
+        _token_cache[token] = (subject, exp)
+    return subject
+
 
 async def get_db():
-    """FastAPI dependency to provide a database session."""
+    """
+    FastAPI dependency to provide a database session.
+
+    FastAPI caches dependency results per request, so every dependency that asks for
+    `get_db` (e.g. `get_current_user` and the endpoint itself) shares one session.
+    """
     async with AsyncSessionLocal() as session:
         yield session
 
@@ -30,14 +76,11 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        email: str | None = payload.get("sub")
+        email = await _decode_token_subject(token)
         if email is None:
             raise credentials_exception
         token_data = user_schema.TokenData(email=email)
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise credentials_exception
 
     user = await user_crud.get_user_by_email(db, email=token_data.email)
@@ -1,12 +1,13 @@
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from collaboration_bridge.api import deps
 from collaboration_bridge.crud.contact import contact_crud
 from collaboration_bridge.models.user import User
+from collaboration_bridge.schemas import dump_list_json
 from collaboration_bridge.schemas.contact import (
     ContactCreate,
     ContactRead,
@@ -35,10 +36,10 @@ async def create_contact(
     if current_user.onboarding_status == OnboardingStatus.NOT_STARTED:
         current_user.onboarding_status = OnboardingStatus.FIRST_CONTACT_ADDED
         db.add(current_user)
+        # eager_defaults returns updated_at via RETURNING, so no refresh is needed
         await db.commit()
-        await db.refresh(current_user)
 
-    return contact
+    return ContactRead.from_orm_trusted(contact)
 
 @router.get("/", response_model=List[ContactRead])
 async def read_contacts(
@@ -46,12 +47,19 @@ async def read_contacts(
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_user),
-) -> List[ContactRead]:
+) -> Response:
     """Retrieve all active contacts for the current user."""
+    # Select only the columns ContactRead needs rather than full ORM objects
     contacts = await contact_crud.get_multi_by_user(
-        db=db, user_id=current_user.id, skip=skip, limit=limit
+        db=db,
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        columns=ContactRead.orm_columns,
+    )
+    return Response(
+        content=dump_list_json(ContactRead, contacts), media_type="application/json"
     )
-    return contacts
 
 @router.get("/{contact_id}", response_model=ContactRead)
 async def read_contact(
@@ -70,7 +78,7 @@ async def read_contact(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found or inactive.",
         )
-    return contact
+    return ContactRead.from_orm_trusted(contact)
 
 @router.patch("/{contact_id}", response_model=ContactRead)
 async def update_contact(
@@ -81,17 +89,16 @@ async def update_contact(
     current_user: User = Depends(deps.get_current_user),
 ) -> ContactRead:
     """Update a contact (Partial Update)."""
-    db_obj = await contact_crud.get_by_user(
-        db=db, user_id=current_user.id, contact_id=contact_id
+    # update_by_user handles existence, ownership, and active status checks.
+    contact = await contact_crud.update_by_user(
+        db=db, user_id=current_user.id, contact_id=contact_id, obj_in=contact_in
     )
-    if not db_obj:
+    if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found or inactive.",
         )
-
-    contact = await contact_crud.update(db=db, db_obj=db_obj, obj_in=contact_in)
-    return contact
+    return ContactRead.from_orm_trusted(contact)
 
 @router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_contact(
@@ -101,16 +108,13 @@ async def delete_contact(
     current_user: User = Depends(deps.get_current_user),
 ) -> None:
     """Soft delete a contact."""
-    # Ensure the contact exists, belongs to the user, and is active before deleting
-    contact = await contact_crud.get_by_user(
+    # Only contacts that exist, belong to the user, and are active get deleted
+    deleted = await contact_crud.remove_by_user(
         db=db, user_id=current_user.id, contact_id=contact_id
     )
-    if not contact:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found or already deleted.",
         )
-
-    # The remove method handles the soft-delete logic
-    await contact_crud.remove(db=db, db_obj=contact)
     return
@@ -1,7 +1,8 @@
 import uuid
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,6 +10,7 @@ from collaboration_bridge.api import deps
 from collaboration_bridge.crud.contact import contact_crud
 from collaboration_bridge.crud.interaction import interaction_crud
 from collaboration_bridge.models.user import User
+from collaboration_bridge.schemas import dump_list_json
 from collaboration_bridge.schemas.interaction import (
     InteractionCreate,
     InteractionRead,
@@ -47,7 +49,7 @@ async def create_interaction_with_tactics(
             detail="Contact not found. You can only log interactions with your own contacts.",
         )
 
-    # Now, create the interaction and its associated logs in a single transaction.
+    # Now, create the interaction and its associated logs (flushed, not yet committed).
     interaction = await interaction_crud.create_with_tactics(
         db=db,
         obj_in=interaction_in.interaction,
@@ -59,10 +61,10 @@ async def create_interaction_with_tactics(
     if current_user.onboarding_status == OnboardingStatus.FIRST_CONTACT_ADDED:
         current_user.onboarding_status = OnboardingStatus.FIRST_INTERACTION_LOGGED
         db.add(current_user)
-        await db.commit()
-        await db.refresh(current_user)
 
-    return interaction
+    # Commit the interaction, its tactic logs and the onboarding transition together
+    await db.commit()
+    return InteractionRead.from_orm_trusted(interaction)
 
 @router.get("/", response_model=List[InteractionRead])
 async def read_interactions_for_contact(
@@ -70,11 +72,22 @@ async def read_interactions_for_contact(
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    after_dt: Optional[datetime] = None,
+    after_id: Optional[uuid.UUID] = None,
     current_user: User = Depends(deps.get_current_user),
-) -> List[InteractionRead]:
+) -> Response:
     """
     Retrieve all interactions for a specific contact belonging to the current user.
+
+    For deep pagination, pass the `interaction_datetime` and `id` of the last
+    interaction already received as `after_dt` and `after_id` instead of `skip`.
     """
+    if (after_dt is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after_dt and after_id must be provided together.",
+        )
+
     # Verify the contact exists and belongs to the user
     contact = await contact_crud.get_by_user(
         db=db, user_id=current_user.id, contact_id=contact_id
@@ -85,7 +98,18 @@ async def read_interactions_for_contact(
             detail="Contact not found.",
         )
 
+    # Select only the columns InteractionRead needs rather than full ORM objects
     interactions = await interaction_crud.get_multi_by_user_and_contact(
-        db=db, user_id=current_user.id, contact_id=contact_id, skip=skip, limit=limit
+        db=db,
+        user_id=current_user.id,
+        contact_id=contact_id,
+        skip=skip,
+        limit=limit,
+        after_dt=after_dt,
+        after_id=after_id,
+        columns=InteractionRead.orm_columns,
+    )
+    return Response(
+        content=dump_list_json(InteractionRead, interactions),
+        media_type="application/json",
     )
-    return interactions
@@ -1,14 +1,15 @@
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 
+import jwt
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from collaboration_bridge.api.deps import get_db
-from collaboration_bridge.core.config import settings
+from collaboration_bridge.api.deps import JWT_ALGORITHMS, JWT_SIGNING_KEY, get_db
+from collaboration_bridge.core.config import get_settings
 from collaboration_bridge.crud import user as user_crud
 from collaboration_bridge.schemas import user as user_schema
-from jose import jwt, JWTError
 
 router = APIRouter()
 
@@ -16,12 +17,11 @@ router = APIRouter()
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     """Creates a JWT access token."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    # JWT time claims are plain epoch seconds, so no datetime objects are needed
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta else 15 * 60
+    to_encode.update({"exp": now + ttl, "iat": now})
+    encoded_jwt = jwt.encode(to_encode, JWT_SIGNING_KEY, algorithm=JWT_ALGORITHMS[0])
     return encoded_jwt
 
 
@@ -35,13 +35,13 @@ async def create_user(
     This endpoint registers a new user in the system with a unique email.
     The user's onboarding process is initialized to `not_started`.
     """
-    db_user = await user_crud.get_user_by_email(db, email=user.email)
-    if db_user:
+    db_user = await user_crud.create_user(db=db, user=user)
+    if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
-    return await user_crud.create_user(db=db, user=user)
+    return db_user
 
 
 @router.post("/token", response_model=user_schema.Token)
@@ -57,13 +57,21 @@ async def login_for_access_token(
     in a form-data body.
     """
     user = await user_crud.get_user_by_email(db, email=form_data.username)
-    if not user or not user_crud.verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = (
+        user_crud.verify_and_update_password(form_data.password, user.hashed_password)
+        if user else (False, None)
+    )
+    if user is None or not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    if new_hash:
+        # Migrate legacy (bcrypt) or outdated-cost hashes now that we know the password
+        user.hashed_password = new_hash
+        await db.commit()
+    access_token_expires = timedelta(minutes=get_settings().ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user.email}, expires_delta=access_token_expires
     )
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,11 +29,33 @@ class Settings(BaseSettings):
             # Development environment
             return self.DATABASE_URL_DEV
 
+    # Connection pool (server databases only; SQLite keeps SQLAlchemy's default pool)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    # Recycle connections before server/proxy idle timeouts close them
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Statement caching
+    # SQLAlchemy compiled-statement cache (per engine)
+    DB_QUERY_CACHE_SIZE: int = 4096
+    # asyncpg server-side prepared statements cached per connection (PostgreSQL only)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 512
+
     # Security settings
     SECRET_KEY: str = "a_very_secret_key_that_should_be_in_env"  # Default for development
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # scrypt cost (log2 of N) for new password hashes. Existing hashes with a different
+    # cost keep verifying; each step doubles login CPU time and memory (14 -> 16 MiB).
+    SCRYPT_ROUNDS: int = 14
+    # Verify token signatures in a worker thread. Only worth it for RSA/EC algorithms;
+    # an HS256 check is cheaper than the thread hand-off.
+    JWT_OFFLOAD_VERIFY: bool = False
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment/.env only once."""
+    return Settings()
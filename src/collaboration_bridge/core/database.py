@@ -1,14 +1,33 @@
 import uuid
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, ClassVar, Dict
 
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from collaboration_bridge.core.config import settings
+from collaboration_bridge.core.config import get_settings
 
 # Create the async engine
-engine = create_async_engine(settings.async_database_url)
+settings = get_settings()
+database_url = make_url(settings.async_database_url)
+engine_kwargs: Dict[str, Any] = {"query_cache_size": settings.DB_QUERY_CACHE_SIZE}
+if database_url.get_backend_name() != "sqlite":
+    # Keep warm connections pooled so requests don't pay a connect/TLS/auth handshake
+    engine_kwargs.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+if database_url.get_driver_name() == "asyncpg":
+    # Reuse server-side prepared statements (parse/plan) across requests on each pooled connection
+    engine_kwargs["connect_args"] = {
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+    }
+engine = create_async_engine(database_url, **engine_kwargs)
 
 # Create a session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -19,6 +38,11 @@ class Base(DeclarativeBase):
     """
     Base declarative class for all models. Standardizes on UUIDs for primary keys.
     """
+    # Fetch server-generated values (e.g. updated_at) via RETURNING as part of the
+    # INSERT/UPDATE itself, so callers don't need a refresh() round-trip afterwards.
+    # DeclarativeBase types this as an instance attribute; it is read per class.
+    __mapper_args__: ClassVar[Dict[str, Any]] = {"eager_defaults": True}  # type: ignore[misc]
+
     # Use UUIDs for primary keys
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
@@ -26,8 +50,6 @@ class Base(DeclarativeBase):
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency to provide a database session."""
+    # Exiting the context manager closes the session
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
@@ -10,7 +10,7 @@ The implementation follows PEP 8, PEP 257, and PEP 484 standards for
 code quality, documentation, and type safety.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 import sqlalchemy as sa
@@ -84,7 +84,7 @@ class SoftDeleteMixin:
         deleted_at: Timestamp when the record was soft deleted (timezone-aware).
         deleted_by: Identifier of user/system that performed the deletion.
         deletion_reason: Optional reason for the deletion.
-        is_deleted: Boolean flag for quick filtering (indexed).
+        is_deleted: Boolean flag for quick filtering.
 
     Example:
         class User(Base, SoftDeleteMixin):
@@ -121,10 +121,10 @@ class SoftDeleteMixin:
         Returns:
             Mapped[Optional[str]]: String column for audit trail.
         """
+        # Audit-only; no query filters on it, so it isn't indexed
         return mapped_column(
             String(255),
             nullable=True,
-            index=True,
             doc="Identifier of user/system that performed the deletion",
         )
 
@@ -146,13 +146,15 @@ class SoftDeleteMixin:
         """Boolean flag for quick filtering of deleted records.
 
         Returns:
-            Mapped[bool]: Boolean column with index for performance.
+            Mapped[bool]: Boolean column.
         """
+        # Not indexed on its own: a two-value column makes a poor standalone index.
+        # Hot queries use per-table partial indexes (WHERE is_deleted IS false)
+        # instead, matching get_active_filter().
         return mapped_column(
             Boolean,
             default=False,
             nullable=False,
-            index=True,
             doc="Boolean flag indicating if the record is soft deleted",
         )
 
@@ -170,11 +172,47 @@ class SoftDeleteMixin:
         Example:
             user.soft_delete(deleted_by="admin", reason="Account cleanup")
         """
-        self.deleted_at = datetime.now()
+        # Timezone-aware to match the TIMESTAMPTZ column
+        self.deleted_at = datetime.now(timezone.utc)
         self.deleted_by = deleted_by
         self.deletion_reason = reason
         self.is_deleted = True
 
+    @classmethod
+    def soft_delete_statement(
+        cls,
+        deleted_by: Optional[str] = None,
+        reason: Optional[str] = None,
+    ) -> Any:
+        """Build a set-based soft delete of active records.
+
+        The returned UPDATE stamps ``deleted_at`` with the database clock, so any
+        number of rows is soft deleted in one statement with no per-row Python work.
+        Callers narrow it with ``.where(...)`` before executing.
+
+        Args:
+            deleted_by: Identifier of user/system performing the deletion.
+            reason: Optional reason for the deletion.
+
+        Returns:
+            SQLAlchemy UPDATE statement limited to active records.
+
+        Example:
+            stmt = User.soft_delete_statement(deleted_by="admin").where(User.id.in_(ids))
+            await session.execute(stmt)
+        """
+        return (
+            sa.update(cls)
+            .where(cls.get_active_filter())
+            .values(
+                is_deleted=True,
+                deleted_at=functions.now(),
+                deleted_by=deleted_by,
+                deletion_reason=reason,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     def restore(self, restored_by: Optional[str] = None) -> None:
         """Restore a soft-deleted record.
 
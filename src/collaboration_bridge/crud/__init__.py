@@ -0,0 +1,9 @@
+from .contact import contact_crud
+from .interaction import interaction_crud
+from .rapport import rapport_tactic_crud
+
+__all__ = [
+    "contact_crud",
+    "interaction_crud",
+    "rapport_tactic_crud",
+]
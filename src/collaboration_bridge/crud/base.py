@@ -1,10 +1,11 @@
 import uuid
-from typing import Any, Dict, Generic, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import and_
+from sqlalchemy import Row, Select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import raiseload, selectinload
 
 from collaboration_bridge.core.database import Base
 from collaboration_bridge.core.mixins import SoftDeleteMixin
@@ -29,16 +30,55 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             return self.model.get_active_filter()
         return True  # If not soft-deletable, always return True (no filter)
 
-    async def get(self, db: AsyncSession, id: uuid.UUID) -> Optional[ModelType]:
-        """Get a single record by ID, filtering out soft-deleted items."""
+    async def _select_columns(
+        self, db: AsyncSession, query: Select[Any], columns: Sequence[str]
+    ) -> Sequence[Row[Any]]:
+        """
+        Run an entity query projected onto just the named columns.
+
+        Returns lightweight `Row` tuples (attribute access by column name) instead
+        of mapped instances, skipping identity-map and relationship bookkeeping.
+        """
+        stmt = query.with_only_columns(*(getattr(self.model, c) for c in columns))
+        return (await db.execute(stmt)).all()
+
+    def _load_options(self, load_relationships: Sequence[str], strict: bool) -> list[Any]:
+        """
+        Build loader options: eager `selectinload` for the named relationships and,
+        in strict mode, `raiseload("*")` so any other relationship access fails fast
+        instead of silently issuing a lazy load (N+1) per row.
+        """
+        options: list[Any] = [
+            selectinload(getattr(self.model, rel)) for rel in load_relationships
+        ]
+        if strict:
+            options.append(raiseload("*"))
+        return options
+
+    async def get(
+        self,
+        db: AsyncSession,
+        id: uuid.UUID,
+        *,
+        load_relationships: Sequence[str] = (),
+        strict: bool = False
+    ) -> Optional[ModelType]:
+        """
+        Get a single record by ID, filtering out soft-deleted items.
+
+        Args:
+            db: Database session.
+            id: Primary key of the record.
+            load_relationships: Relationship names to eager load with `selectinload`.
+            strict: Raise on access to any relationship that wasn't eager loaded.
+        """
         query = select(self.model).where(
-            and_(
-                self.model.id == id,
-                self._get_active_filter()
-            )
+            self.model.id == id,
+            self._get_active_filter(),
         )
-        result = await db.execute(query)
-        return result.scalars().first()
+        if load_relationships or strict:
+            query = query.options(*self._load_options(load_relationships, strict))
+        return await db.scalar(query)
 
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType | Dict[str, Any]) -> ModelType:
         """Create a new record."""
@@ -50,10 +90,30 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
+        # Server defaults (created_at/updated_at) come back through INSERT ... RETURNING
+        # (eager_defaults), no refresh needed
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
+    async def bulk_create(
+        self, db: AsyncSession, *, objs_in: Sequence[CreateSchemaType | Dict[str, Any]]
+    ) -> List[uuid.UUID]:
+        """
+        Create many records at once and return their IDs.
+
+        Runs as a single executemany INSERT ... RETURNING instead of one
+        flush per object; no ORM instances are loaded.
+        """
+        if not objs_in:
+            return []
+        rows = [
+            obj if isinstance(obj, dict) else obj.model_dump(exclude_unset=True)
+            for obj in objs_in
+        ]
+        ids = (await db.scalars(insert(self.model).returning(self.model.id), rows)).all()
+        await db.commit()
+        return list(ids)
+
     async def update(
         self, db: AsyncSession, *, db_obj: ModelType, obj_in: UpdateSchemaType | Dict[str, Any]
     ) -> ModelType:
@@ -69,8 +129,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 setattr(db_obj, field, value)
 
         db.add(db_obj)
+        # updated_at comes back through UPDATE ... RETURNING (eager_defaults), no refresh needed
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
     async def remove(
@@ -98,10 +158,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         else:
             await db.delete(db_obj)
 
+        # deleted_at is stamped in Python by soft_delete() and updated_at comes back via
+        # RETURNING (eager_defaults), so the returned object needs no refresh
         await db.commit()
-        # Refresh if soft-deleted to update the deleted_at timestamp in the returned object
-        if self.is_soft_deletable:
-            await db.refresh(db_obj)
         return db_obj
 
     async def restore(
@@ -1,7 +1,7 @@
 import uuid
-from typing import List, Optional
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import and_
+from sqlalchemy import Row, lambda_stmt, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -28,34 +28,113 @@ class CRUDContact(CRUDBase[Contact, ContactCreate, ContactUpdate]):
         self, db: AsyncSession, *, user_id: uuid.UUID, contact_id: uuid.UUID
     ) -> Optional[Contact]:
         """Get a specific contact only if it belongs to the user and is active."""
-        query = select(self.model).where(
-            and_(
-                self.model.id == contact_id,
-                self.model.user_id == user_id,
-                self._get_active_filter() # Inherited soft-delete check
+        # Runs on most contact/interaction requests, so the statement is a cached
+        # lambda: built and compiled once, with only the ids bound per call.
+        model = self.model
+        stmt = lambda_stmt(
+            lambda: select(model).where(
+                model.id == contact_id,
+                model.user_id == user_id,
+                model.get_active_filter(),  # Soft-delete check
             )
         )
-        result = await db.execute(query)
-        return result.scalars().first()
+        contact: Optional[Contact] = await db.scalar(stmt)
+        return contact
+
+    async def update_by_user(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        contact_id: uuid.UUID,
+        obj_in: ContactUpdate,
+    ) -> Optional[Contact]:
+        """
+        Update a contact only if it belongs to the user and is active (partial update).
+
+        The ownership check and the write run as one UPDATE ... RETURNING statement
+        instead of a SELECT followed by an UPDATE. Returns None if no contact matched.
+        """
+        owned = (
+            self.model.id == contact_id,
+            self.model.user_id == user_id,
+            self._get_active_filter(),
+        )
+        # populate_existing overwrites a Contact already in the identity map with the
+        # returned row; otherwise the caller would get the stale, pre-update object.
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            # Nothing to write; just return the current row
+            query = (
+                select(self.model)
+                .where(*owned)
+                .execution_options(populate_existing=True)
+            )
+            return await db.scalar(query)
+
+        stmt = (
+            update(self.model)
+            .where(*owned)
+            .values(**update_data)
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        contact = await db.scalar(stmt)
+        await db.commit()
+        return contact
+
+    async def remove_by_user(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        contact_id: uuid.UUID,
+        deleted_by: Optional[str] = None,
+        reason: Optional[str] = None
+    ) -> bool:
+        """
+        Soft delete a contact only if it belongs to the user and is active.
+
+        Runs as a single UPDATE without loading the row first. Returns False if no
+        contact matched.
+        """
+        stmt = (
+            self.model.soft_delete_statement(deleted_by=deleted_by, reason=reason)
+            .where(self.model.id == contact_id, self.model.user_id == user_id)
+            .returning(self.model.id)
+        )
+        deleted_id = await db.scalar(stmt)
+        await db.commit()
+        return deleted_id is not None
 
     async def get_multi_by_user(
-        self, db: AsyncSession, *, user_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> List[Contact]:
-        """Get all active contacts for a specific user."""
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None
+    ) -> Sequence[Contact] | Sequence[Row[Any]]:
+        """
+        Get all active contacts for a specific user.
+
+        If `columns` is given, only those columns are selected and plain rows are
+        returned instead of Contact instances.
+        """
         query = (
             select(self.model)
             .where(
-                and_(
-                    self.model.user_id == user_id,
-                    self._get_active_filter()
-                )
+                self.model.user_id == user_id,
+                self._get_active_filter(),
             )
             .order_by(self.model.name)
             .offset(skip)
             .limit(limit)
         )
-        result = await db.execute(query)
-        return result.scalars().all()
+        if columns:
+            return await self._select_columns(db, query, columns)
+        return (await db.scalars(query)).all()
 
 # Instantiate the CRUD class for use in the API layer
 contact_crud = CRUDContact(Contact)
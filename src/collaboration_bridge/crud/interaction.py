@@ -1,7 +1,9 @@
 import uuid
-from typing import List
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
 
-from sqlalchemy import and_
+from pydantic import TypeAdapter
+from sqlalchemy import Row, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -11,6 +13,9 @@ from collaboration_bridge.models.rapport import InteractionTacticLog
 from collaboration_bridge.schemas.interaction import InteractionCreate
 from collaboration_bridge.schemas.rapport import InteractionTacticLogCreate
 
+# Dumps a whole batch of tactic logs in one pydantic-core call instead of per row
+_tactic_logs_adapter = TypeAdapter(List[InteractionTacticLogCreate])
+
 
 class CRUDInteraction(CRUDBase[Interaction, InteractionCreate, None]):
     """
@@ -26,26 +31,32 @@ class CRUDInteraction(CRUDBase[Interaction, InteractionCreate, None]):
     ) -> Interaction:
         """
         Create a new interaction and its associated tactic logs in a single transaction.
+
+        The rows are flushed but not committed; the caller commits once at the end
+        of the request so any further writes share the same transaction.
         """
-        # Create the main interaction object
+        logs_data = _tactic_logs_adapter.dump_python(tactic_logs_in)
+        # Create the main interaction object, carrying a JSON copy of its tactic logs
         interaction_data = obj_in.model_dump()
-        interaction = Interaction(**interaction_data, user_id=user_id)
+        interaction = Interaction(
+            **interaction_data,
+            user_id=user_id,
+            tactic_logs_json=[
+                {**log_data, "tactic_id": str(log_data["tactic_id"])}
+                for log_data in logs_data
+            ],
+        )
         db.add(interaction)
 
         # Flush the session to get the generated ID for the interaction
         await db.flush()
 
-        # Create the tactic log objects
-        for log_in in tactic_logs_in:
-            log_data = log_in.model_dump()
-            db_log = InteractionTacticLog(
-                **log_data,
-                interaction_id=interaction.id
-            )
-            db.add(db_log)
+        # Create the tactic logs with a single bulk INSERT
+        if logs_data:
+            for log_data in logs_data:
+                log_data["interaction_id"] = interaction.id
+            await db.execute(insert(InteractionTacticLog), logs_data)
 
-        await db.commit()
-        await db.refresh(interaction)
         return interaction
 
     async def get_multi_by_user_and_contact(
@@ -55,24 +66,46 @@ class CRUDInteraction(CRUDBase[Interaction, InteractionCreate, None]):
         user_id: uuid.UUID,
         contact_id: uuid.UUID,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Interaction]:
-        """Get all active interactions for a specific user and contact."""
+        limit: int = 100,
+        after_dt: Optional[datetime] = None,
+        after_id: Optional[uuid.UUID] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Sequence[Interaction] | Sequence[Row[Any]]:
+        """
+        Get all active interactions for a specific user and contact, newest first.
+
+        When both `after_dt` and `after_id` (the last row of the previous page) are
+        given, keyset pagination is used instead of OFFSET: the query seeks straight
+        to the next page on the composite index, so deep pages cost the same as the
+        first one. `skip` is ignored in that case. Passing only one of the two
+        raises ValueError rather than silently falling back to OFFSET.
+
+        If `columns` is given, only those columns are selected and plain rows are
+        returned instead of Interaction instances.
+        """
+        if (after_dt is None) != (after_id is None):
+            raise ValueError("after_dt and after_id must be given together")
         query = (
             select(self.model)
             .where(
-                and_(
-                    self.model.user_id == user_id,
-                    self.model.contact_id == contact_id,
-                    self._get_active_filter()
-                )
+                self.model.user_id == user_id,
+                self.model.contact_id == contact_id,
+                self._get_active_filter(),
             )
-            .order_by(self.model.interaction_datetime.desc())
-            .offset(skip)
+            # The id tie-breaker keeps the order total, which keyset paging relies on
+            .order_by(self.model.interaction_datetime.desc(), self.model.id.desc())
             .limit(limit)
         )
-        result = await db.execute(query)
-        return result.scalars().all()
+        if after_dt is not None:
+            query = query.where(
+                tuple_(self.model.interaction_datetime, self.model.id)
+                < tuple_(after_dt, after_id)
+            )
+        else:
+            query = query.offset(skip)
+        if columns:
+            return await self._select_columns(db, query, columns)
+        return (await db.scalars(query)).all()
 
 # Instantiate the CRUD class for use in the API layer
 interaction_crud = CRUDInteraction(Interaction)
@@ -1,11 +1,11 @@
-from typing import List
+from typing import List, Optional, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from collaboration_bridge.crud.base import CRUDBase
-from collaboration_bridge.models.rapport import InteractionTacticLog, RapportTactic
-from collaboration_bridge.schemas.rapport import InteractionTacticLogCreate
+from collaboration_bridge.models.rapport import RapportTactic
+from collaboration_bridge.schemas.rapport import RapportTacticRead
 
 
 class CRUDRapportTactic(CRUDBase[RapportTactic, None, None]):
@@ -13,16 +13,29 @@ class CRUDRapportTactic(CRUDBase[RapportTactic, None, None]):
     CRUD operations for RapportTactics.
     This is mostly a read-only model from the API perspective,
     so Create/Update schemas are None.
+
+    The tactics are seed data that practically never change, so the full list is
+    cached in-process. Schemas are cached rather than ORM rows, which would stay
+    bound to the session they were loaded in.
     """
-    async def get_all(self, db: AsyncSession) -> List[RapportTactic]:
-        """Get all available rapport tactics."""
-        query = select(self.model).order_by(self.model.name)
-        result = await db.execute(query)
-        return result.scalars().all()
+    def __init__(self, model: Type[RapportTactic]):
+        super().__init__(model)
+        self._cache: Optional[List[RapportTacticRead]] = None
+
+    async def get_all(self, db: AsyncSession) -> List[RapportTacticRead]:
+        """Get all available rapport tactics, served from the in-process cache when warm."""
+        if self._cache is None:
+            query = select(self.model).order_by(self.model.name)
+            tactics = (await db.scalars(query)).all()
+            self._cache = [RapportTacticRead.from_orm_trusted(t) for t in tactics]
+        return self._cache
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached tactics; call after writing to the rapport_tactics table."""
+        self._cache = None
 
-class CRUDInteractionTacticLog(CRUDBase[InteractionTacticLog, InteractionTacticLogCreate, None]):
-    """CRUD operations for InteractionTacticLogs."""
-    pass
+# InteractionTacticLogs have no CRUD object of their own: they are only written by
+# interaction_crud.create_with_tactics, which also keeps Interaction.tactic_logs_json
+# (the denormalized copy the list endpoints read) in sync.
 
 rapport_tactic_crud = CRUDRapportTactic(RapportTactic)
-interaction_tactic_log_crud = CRUDInteractionTacticLog(InteractionTacticLog)
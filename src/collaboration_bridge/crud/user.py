@@ -1,16 +1,37 @@
+from sqlalchemy import lambda_stmt
+from sqlalchemy.dialects.postgresql import Insert as PgInsert, insert as pg_insert
+from sqlalchemy.dialects.sqlite import Insert as SqliteInsert, insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from passlib.context import CryptContext
 
+from collaboration_bridge.core.config import get_settings
 from collaboration_bridge.models.user import User
 from collaboration_bridge.schemas.user import UserCreate
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use scrypt (stdlib hashlib, OpenSSL-backed). bcrypt stays listed so
+# existing hashes keep verifying; they are upgraded on the user's next login.
+pwd_context = CryptContext(
+    schemes=["scrypt", "bcrypt"],
+    deprecated="auto",
+    scrypt__rounds=get_settings().SCRYPT_ROUNDS,
+)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verifies a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verifies a password and returns a replacement hash if it needs upgrading.
+
+    The replacement (otherwise None) is returned when the stored hash uses a
+    deprecated scheme or cost. Password hashing is deliberately slow, so this is
+    only called when issuing a token (login); authenticated requests only check
+    the JWT signature.
+    """
+    verified: bool
+    new_hash: str | None
+    verified, new_hash = pwd_context.verify_and_update(plain_password, hashed_password)
+    return verified, new_hash
 
 
 def get_password_hash(password: str) -> str:
@@ -20,19 +41,40 @@ def get_password_hash(password: str) -> str:
 
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     """Retrieves a user from the database by email."""
-    result = await db.execute(select(User).filter(User.email == email))
-    return result.scalars().first()
+    # Runs on every authenticated request; the lambda statement is built and
+    # compiled once and only the email is bound per call.
+    stmt = lambda_stmt(lambda: select(User).filter(User.email == email))
+    user: User | None = await db.scalar(stmt)
+    return user
+
 
+async def create_user(db: AsyncSession, user: UserCreate) -> User | None:
+    """
+    Creates a new user in the database.
 
-async def create_user(db: AsyncSession, user: UserCreate) -> User:
-    """Creates a new user in the database."""
+    Returns None if a user with the same email already exists. The check and the
+    insert happen in a single INSERT ... ON CONFLICT DO NOTHING RETURNING statement,
+    so concurrent registrations cannot race between a lookup and the insert.
+    """
     hashed_password = get_password_hash(user.password)
-    db_user = User(
-        email=user.email,
-        full_name=user.full_name,
-        hashed_password=hashed_password,
+    # Both supported backends (PostgreSQL and SQLite) implement ON CONFLICT.
+    insert_stmt: PgInsert | SqliteInsert = (
+        pg_insert(User)
+        if db.get_bind().dialect.name == "postgresql"
+        else sqlite_insert(User)
+    )
+    stmt = (
+        insert_stmt
+        .values(
+            email=user.email,
+            full_name=user.full_name,
+            hashed_password=hashed_password,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
-    db.add(db_user)
+    # INSERT ... RETURNING hands back the full row (including server defaults),
+    # so no follow-up refresh SELECT is needed after the commit.
+    db_user = (await db.execute(stmt)).scalar_one_or_none()
     await db.commit()
-    await db.refresh(db_user)
     return db_user
\ No newline at end of file
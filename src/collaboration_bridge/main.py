@@ -2,7 +2,9 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
+from sqlalchemy.orm import configure_mappers
 
 # Import the routers
 from collaboration_bridge.api.v1.contacts import router as contacts_v1_router
@@ -12,9 +14,10 @@ from collaboration_bridge.api.v1.interactions import (
 from collaboration_bridge.api.v1.onboarding import router as onboarding_v1_router
 from collaboration_bridge.api.v1.rapport import router as rapport_v1_router
 from collaboration_bridge.api.v1.users import router as users_v1_router
-from collaboration_bridge.core.config import settings
+from collaboration_bridge.core.config import get_settings
 from collaboration_bridge.core.database import AsyncSessionLocal
 from collaboration_bridge.core.seed_data import SEED_TACTICS
+from collaboration_bridge.crud.rapport import rapport_tactic_crud
 from collaboration_bridge.models.rapport import RapportTactic
 
 
@@ -24,12 +27,12 @@ async def lifespan(app: FastAPI):
     Application lifespan manager to handle startup and shutdown events.
     Seeds the database with rapport tactics on startup if the table is empty.
     """
+    # Resolve all relationships up front so the first request doesn't pay for it
+    configure_mappers()
     async with AsyncSessionLocal() as db:
-        result = await db.execute(select(RapportTactic))
-        if result.scalars().first() is None:
-            for tactic_data in SEED_TACTICS:
-                db.add(RapportTactic(**tactic_data))
-            await db.commit()
+        if await db.scalar(select(RapportTactic).limit(1)) is None:
+            await rapport_tactic_crud.bulk_create(db, objs_in=SEED_TACTICS)
+            rapport_tactic_crud.invalidate_cache()
     yield
     # Shutdown logic can be added here if needed
 
@@ -38,6 +41,7 @@ app = FastAPI(
     description="A science-backed manager interaction tracking application for building better workplace relationships through validated rapport-building techniques.",
     version="0.1.0",
     lifespan=lifespan,  # Hook the lifespan manager to the app
+    default_response_class=ORJSONResponse,  # Rust-backed JSON encoding for all responses
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -59,7 +63,7 @@ app.include_router(api_v1_router)
 async def root():
     """Root endpoint for the Collaboration Bridge API."""
     return {
-        "message": f"Welcome to the Collaboration Bridge API - Env: {settings.ENVIRONMENT}",
+        "message": f"Welcome to the Collaboration Bridge API - Env: {get_settings().ENVIRONMENT}",
         "description": "A science-backed manager interaction tracking application",
         "version": "0.1.0",
         "docs": "/docs",
@@ -72,5 +76,5 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "environment": settings.ENVIRONMENT
+        "environment": get_settings().ENVIRONMENT
     }
@@ -5,7 +5,18 @@ of all tables before any operations are performed, which prevents circular
 import and mapper configuration errors.
 """
 
-from .contact import Contact
-from .interaction import Interaction
-from .rapport import InteractionTacticLog, RapportTactic
+from .contact import Contact, ContactLevel
+from .interaction import Interaction, InteractionMedium
+from .rapport import InteractionTacticLog, RapportTactic, ScientificDomain
 from .user import User
+
+__all__ = [
+    "Contact",
+    "ContactLevel",
+    "Interaction",
+    "InteractionMedium",
+    "InteractionTacticLog",
+    "RapportTactic",
+    "ScientificDomain",
+    "User",
+]
@@ -42,3 +42,15 @@ class Contact(Base, TimestampMixin, SoftDeleteMixin):
     # Relationships
     user: Mapped["User"] = relationship(back_populates="contacts")
     interactions: Mapped[List["Interaction"]] = relationship(back_populates="contact")
+
+    __table_args__ = (
+        # Backs the per-user contact list (active contacts ordered by name); the partial
+        # predicate keeps soft-deleted rows out of the index on PostgreSQL and must
+        # match get_active_filter() (IS false) for the planner to use it.
+        sa.Index(
+            "ix_contacts_user_name_active",
+            "user_id",
+            "name",
+            postgresql_where=sa.text("is_deleted IS false"),
+        ),
+    )
@@ -1,9 +1,10 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, List
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from collaboration_bridge.core.database import Base
@@ -51,3 +52,26 @@ class Interaction(Base, TimestampMixin, SoftDeleteMixin):
 
     # Techniques used during the interaction (Many-to-Many via Association Object)
     tactic_logs: Mapped[List["InteractionTacticLog"]] = relationship(back_populates="interaction")
+
+    # Read-only denormalized copy of the tactic logs ({tactic_id, effectiveness_score, notes}),
+    # written in the same INSERT so list endpoints can return them without a JOIN.
+    # The interaction_tactic_logs table remains the source of truth for integrity;
+    # create_with_tactics is the only write path for both.
+    tactic_logs_json: Mapped[List[dict[str, Any]]] = mapped_column(
+        sa.JSON().with_variant(JSONB, "postgresql"), nullable=False, server_default="[]"
+    )
+
+    __table_args__ = (
+        # Backs the per-contact timeline query (filter on user/contact, newest first):
+        # the DESC ordering removes the sort and supports keyset paging. The partial
+        # predicate must match get_active_filter() (IS false) or PostgreSQL won't
+        # use the index.
+        sa.Index(
+            "ix_interactions_user_contact_dt",
+            "user_id",
+            "contact_id",
+            sa.text("interaction_datetime DESC"),
+            sa.text("id DESC"),
+            postgresql_where=sa.text("is_deleted IS false"),
+        ),
+    )
@@ -26,5 +26,12 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
     )
 
     # Relationships
-    contacts: Mapped[List["Contact"]] = relationship(back_populates="user")
-    interactions: Mapped[List["Interaction"]] = relationship(back_populates="user")
+    # The user is loaded on every authenticated request, so these collections are
+    # never loaded implicitly: accessing them without an explicit eager-load option
+    # raises instead of issuing a hidden query (which async sessions can't do anyway).
+    # Callers that need them opt in with CRUDBase.get(load_relationships=[...]),
+    # which uses selectinload.
+    contacts: Mapped[List["Contact"]] = relationship(back_populates="user", lazy="raise")
+    interactions: Mapped[List["Interaction"]] = relationship(
+        back_populates="user", lazy="raise"
+    )
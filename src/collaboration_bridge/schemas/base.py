@@ -1,5 +1,7 @@
+import sys
 import uuid
 from datetime import datetime
+from typing import Any, ClassVar, Self, cast
 
 from pydantic import BaseModel, ConfigDict
 
@@ -10,8 +12,60 @@ class BaseSchema(BaseModel):
     # 'extra="forbid"' enhances security by rejecting unexpected fields.
     model_config = ConfigDict(from_attributes=True, extra="forbid")
 
+    # (field name, ORM attribute name) pairs read by `from_orm_trusted`
+    __orm_fields__: ClassVar[tuple[tuple[str, str], ...]] = ()
+    # ORM attribute names the schema reads, for column-projected queries
+    orm_columns: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the interned field/attribute names once the fields are known."""
+        super().__pydantic_init_subclass__(**kwargs)
+        # Only plain string aliases name an ORM attribute; AliasChoices/AliasPath
+        # (inbound-only) fall back to the field name.
+        cls.__orm_fields__ = tuple(
+            (
+                sys.intern(name),
+                sys.intern(
+                    field.validation_alias
+                    if isinstance(field.validation_alias, str)
+                    else name
+                ),
+            )
+            for name, field in cls.model_fields.items()
+        )
+        cls.orm_columns = tuple(attr for _, attr in cls.__orm_fields__)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> Self:
+        """
+        Build the schema from a trusted ORM row without running validation.
+
+        `obj` may be a mapped instance or a column-projected `Row` selecting
+        `orm_columns`; only attribute access is needed.
+
+        Rows coming out of the database already satisfy the column types, so the
+        response path can skip pydantic validation via `model_construct`. Inbound
+        API payloads must keep going through `model_validate`.
+        """
+        # The pydantic mypy plugin types model_construct as returning the declaring
+        # class (BaseSchema) rather than Self
+        return cast(Self, cls.model_construct(**cls._orm_data(obj)))
+
+    @classmethod
+    def _orm_data(cls, obj: Any) -> dict[str, Any]:
+        """Collect the field values for `from_orm_trusted` from an ORM row."""
+        get = getattr
+        return {name: get(obj, attr) for name, attr in cls.__orm_fields__}
+
 class CoreRead(BaseSchema):
     """Schema for core attributes returned in read operations."""
+    # Read schemas are built server-side and never mutated; freezing them also
+    # makes instances safe to share (e.g. from in-process caches).
+    # 'extra="forbid"' only guards inbound payloads; output schemas are populated
+    # from trusted rows, so they skip the check.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: uuid.UUID
     created_at: datetime
     updated_at: datetime
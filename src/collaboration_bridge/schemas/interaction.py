@@ -1,11 +1,12 @@
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, List, Optional
 
-from pydantic import Field, field_validator
+from pydantic import AwareDatetime, Field
 
 from collaboration_bridge.models.interaction import InteractionMedium
 from collaboration_bridge.schemas.base import BaseSchema, CoreRead
+from collaboration_bridge.schemas.rapport import InteractionTacticLogBase
 
 
 class InteractionBase(BaseSchema):
@@ -22,14 +23,24 @@ class InteractionBase(BaseSchema):
 class InteractionCreate(InteractionBase):
     """Schema for creating a new Interaction."""
     contact_id: uuid.UUID
-
-    @field_validator('interaction_datetime')
-    def check_datetime_is_timezone_aware(cls, v: datetime) -> datetime:
-        """Ensures timestamps are timezone-aware for PostgreSQL consistency (TIMESTAMPTZ)."""
-        if v.tzinfo is None:
-            raise ValueError("Interaction datetime must be timezone-aware.")
-        return v
+    # Timestamps must be timezone-aware for PostgreSQL consistency (TIMESTAMPTZ).
+    # AwareDatetime enforces this inside pydantic-core, with no Python validator call.
+    interaction_datetime: AwareDatetime
 
 class InteractionRead(InteractionBase, CoreRead):
     """Schema for reading Interaction data."""
     contact_id: uuid.UUID
+    # Read from the denormalized JSON column, avoiding a join on the tactic log table
+    tactic_logs: List[InteractionTacticLogBase] = Field(
+        default_factory=list, validation_alias="tactic_logs_json"
+    )
+
+    @classmethod
+    def _orm_data(cls, obj: Any) -> dict[str, Any]:
+        """Collect row values; nested tactic logs are parsed from their JSON form."""
+        data = super()._orm_data(obj)
+        # The JSON column stores UUIDs as strings, so the (small) nested items are validated
+        data["tactic_logs"] = [
+            InteractionTacticLogBase.model_validate(log) for log in obj.tactic_logs_json
+        ]
+        return data
@@ -1,5 +1,7 @@
 from enum import Enum
-from pydantic import BaseModel, Field
+from typing import Literal, get_args
+
+from pydantic import BaseModel, ConfigDict, Field
 
 class OnboardingStatus(str, Enum):
     """
@@ -12,14 +14,27 @@ class OnboardingStatus(str, Enum):
     COMPLETED = "completed"
 
 
+# String values of OnboardingStatus. Response schemas validate these with a plain
+# string comparison instead of enum coercion; the check below fails at import if
+# the two drift apart.
+OnboardingStatusValue = Literal[
+    "not_started",
+    "profile_complete",
+    "first_contact_added",
+    "first_interaction_logged",
+    "completed",
+]
+
+if set(get_args(OnboardingStatusValue)) != {s.value for s in OnboardingStatus}:
+    raise RuntimeError("OnboardingStatusValue is out of sync with OnboardingStatus")
+
+
 class OnboardingStep(BaseModel):
     """
     Schema for representing the current state of the onboarding process.
     """
-    status: OnboardingStatus = Field(..., description="The current onboarding status for the user.")
+    status: OnboardingStatusValue = Field(..., description="The current onboarding status for the user.")
     next_step: str | None = Field(None, description="A hint for the next action the user should take.")
     is_complete: bool = Field(..., description="Indicates whether the user has completed the entire onboarding flow.")
 
-    class Config:
-        use_enum_values = True
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
@@ -20,6 +20,7 @@ class UserRead(UserBase):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class Token(BaseModel):
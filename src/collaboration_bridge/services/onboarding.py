@@ -3,6 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from collaboration_bridge.models.user import User
 from collaboration_bridge.schemas.onboarding import OnboardingStatus, OnboardingStep
 
+# Guidance shown for each status. OnboardingStatus is a str Enum, so lookups also
+# match the plain strings loaded from the database.
+_NEXT_STEP: dict[str, str] = {
+    OnboardingStatus.NOT_STARTED: "Welcome! The first step is to add your first manager as a contact.",
+    OnboardingStatus.PROFILE_COMPLETE: "Great! Now, add your first manager as a contact to begin tracking interactions.",
+    OnboardingStatus.FIRST_CONTACT_ADDED: "Excellent! Your first contact is added. Now, log your first interaction with them.",
+    OnboardingStatus.COMPLETED: "You have completed the onboarding process. Keep up the great work!",
+}
 
 class OnboardingService:
     """
@@ -18,25 +26,17 @@ class OnboardingService:
         Determines the user's current onboarding step and provides guidance for the next action.
         If the user has just logged their first interaction, it automatically transitions them to 'completed'.
         """
-        # If the user has logged their first interaction, complete the onboarding
+        # If the user has logged their first interaction, complete the onboarding.
+        # This is the only write; every other status is served without touching the session.
         if self.user.onboarding_status == OnboardingStatus.FIRST_INTERACTION_LOGGED:
             self.user.onboarding_status = OnboardingStatus.COMPLETED
             self.db.add(self.user)
+            # No refresh needed: the in-memory user already reflects the change
             await self.db.commit()
-            await self.db.refresh(self.user)
 
         status = self.user.onboarding_status
         is_complete = status == OnboardingStatus.COMPLETED
-        next_step_message = None
-
-        if status == OnboardingStatus.NOT_STARTED:
-            next_step_message = "Welcome! The first step is to add your first manager as a contact."
-        elif status == OnboardingStatus.PROFILE_COMPLETE:
-            next_step_message = "Great! Now, add your first manager as a contact to begin tracking interactions."
-        elif status == OnboardingStatus.FIRST_CONTACT_ADDED:
-            next_step_message = "Excellent! Your first contact is added. Now, log your first interaction with them."
-        elif status == OnboardingStatus.COMPLETED:
-            next_step_message = "You have completed the onboarding process. Keep up the great work!"
+        next_step_message = _NEXT_STEP.get(status)
 
         return OnboardingStep(
             status=status,
@@ -1,5 +1,7 @@
 import pytest
+import pytest_asyncio
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 import os
 
@@ -47,4 +49,17 @@ def db_session(engine):
 def reset_factory_sequences():
     """Reset factory counters between tests"""
     from tests.factories import reset_all_sequences
-    reset_all_sequences()
\ No newline at end of file
+    reset_all_sequences()
+
+@pytest_asyncio.fixture
+async def async_db():
+    """Async session on a fresh in-memory SQLite database, as the API layer uses"""
+    from collaboration_bridge.core.database import Base
+    import collaboration_bridge.models  # noqa: F401  (registers all tables)
+
+    eng = create_async_engine("sqlite+aiosqlite://")
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(eng, expire_on_commit=False) as session:
+        yield session
+    await eng.dispose()
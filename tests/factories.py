@@ -3,7 +3,7 @@ import factory
 import factory.random
 from factory.alchemy import SQLAlchemyModelFactory
 
-from src.collaboration_bridge.models.user import User
+from collaboration_bridge.models import User
 
 # Global seed for deterministic data
 factory.random.reseed_random(42)
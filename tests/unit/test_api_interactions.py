@@ -0,0 +1,25 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from collaboration_bridge.api.v1.interactions import read_interactions_for_contact
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        {"after_dt": datetime(2026, 1, 1, tzinfo=timezone.utc)},
+        {"after_id": uuid.uuid4()},
+    ],
+)
+async def test_read_interactions_rejects_partial_keyset_cursor(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        # The cursor is checked before the database or user are touched
+        await read_interactions_for_contact(
+            contact_id=uuid.uuid4(), db=None, current_user=None, **cursor
+        )
+
+    assert exc_info.value.status_code == 422
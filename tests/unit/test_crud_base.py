@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from collaboration_bridge.crud.contact import contact_crud
+from collaboration_bridge.models import (
+    Contact,
+    ContactLevel,
+    Interaction,
+    InteractionMedium,
+    User,
+)
+
+
+async def _contact_with_interaction(db):
+    user = User(email="owner@test.local", full_name="Owner", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    contact = Contact(user_id=user.id, name="Dana", level=ContactLevel.MENTOR)
+    db.add(contact)
+    await db.flush()
+    db.add(
+        Interaction(
+            user_id=user.id,
+            contact_id=contact.id,
+            interaction_datetime=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            medium=InteractionMedium.VIDEO_CALL,
+            topic="1:1",
+            rapport_score_post=7,
+        )
+    )
+    await db.commit()
+    contact_id = contact.id
+    db.expunge_all()
+    return contact_id
+
+
+@pytest.mark.asyncio
+async def test_get_eager_loads_requested_relationships(async_db):
+    contact_id = await _contact_with_interaction(async_db)
+
+    contact = await contact_crud.get(
+        async_db, contact_id, load_relationships=["interactions"]
+    )
+
+    # Already loaded: touching it doesn't need (async-incompatible) lazy IO
+    assert [i.topic for i in contact.interactions] == ["1:1"]
+
+
+@pytest.mark.asyncio
+async def test_get_strict_raises_on_unloaded_relationship(async_db):
+    contact_id = await _contact_with_interaction(async_db)
+
+    contact = await contact_crud.get(async_db, contact_id, strict=True)
+
+    with pytest.raises(InvalidRequestError):
+        contact.interactions
@@ -0,0 +1,64 @@
+import pytest
+
+from collaboration_bridge.crud.contact import contact_crud
+from collaboration_bridge.models import Contact, ContactLevel, User
+from collaboration_bridge.schemas.contact import ContactUpdate
+
+
+async def _user_with_contact(db):
+    user = User(email="owner@test.local", full_name="Owner", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    contact = Contact(
+        user_id=user.id, name="Dana", title="CEO", level=ContactLevel.DIRECT_MANAGER
+    )
+    db.add(contact)
+    await db.commit()
+    return user, contact
+
+
+@pytest.mark.asyncio
+async def test_update_by_user_refreshes_contact_already_in_session(async_db):
+    user, contact = await _user_with_contact(async_db)
+
+    updated = await contact_crud.update_by_user(
+        async_db,
+        user_id=user.id,
+        contact_id=contact.id,
+        obj_in=ContactUpdate(title="CTO"),
+    )
+
+    assert updated is contact
+    assert updated.title == "CTO"
+
+
+@pytest.mark.asyncio
+async def test_update_by_user_with_empty_payload_returns_current_row(async_db):
+    user, contact = await _user_with_contact(async_db)
+    # Change the row behind the session's back
+    await async_db.execute(
+        Contact.__table__.update().where(Contact.id == contact.id).values(title="CTO")
+    )
+
+    current = await contact_crud.update_by_user(
+        async_db, user_id=user.id, contact_id=contact.id, obj_in=ContactUpdate()
+    )
+
+    assert current.title == "CTO"
+
+
+@pytest.mark.asyncio
+async def test_update_by_user_ignores_other_users_contacts(async_db):
+    _, contact = await _user_with_contact(async_db)
+    other = User(email="other@test.local", full_name="Other", hashed_password="x")
+    async_db.add(other)
+    await async_db.commit()
+
+    result = await contact_crud.update_by_user(
+        async_db,
+        user_id=other.id,
+        contact_id=contact.id,
+        obj_in=ContactUpdate(title="CTO"),
+    )
+
+    assert result is None
@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from collaboration_bridge.crud.interaction import interaction_crud
+from collaboration_bridge.models import (
+    Contact,
+    ContactLevel,
+    InteractionMedium,
+    InteractionTacticLog,
+    RapportTactic,
+    ScientificDomain,
+    User,
+)
+from collaboration_bridge.schemas.interaction import InteractionCreate
+from collaboration_bridge.schemas.rapport import InteractionTacticLogCreate
+
+
+async def _user_and_contact(db):
+    user = User(email="owner@test.local", full_name="Owner", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    contact = Contact(user_id=user.id, name="Dana", level=ContactLevel.MENTOR)
+    db.add(contact)
+    await db.commit()
+    return user, contact
+
+
+def _interaction_in(contact, when, topic="1:1"):
+    return InteractionCreate(
+        contact_id=contact.id,
+        interaction_datetime=when,
+        medium=InteractionMedium.VIDEO_CALL,
+        topic=topic,
+        rapport_score_post=7,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_with_tactics_writes_logs_and_json_copy(async_db):
+    user, contact = await _user_and_contact(async_db)
+    tactic = RapportTactic(
+        name="Mirroring", description="-", domain=ScientificDomain.COMMUNICATION
+    )
+    async_db.add(tactic)
+    await async_db.flush()
+
+    interaction = await interaction_crud.create_with_tactics(
+        async_db,
+        obj_in=_interaction_in(contact, datetime(2026, 1, 1, tzinfo=timezone.utc)),
+        user_id=user.id,
+        tactic_logs_in=[
+            InteractionTacticLogCreate(tactic_id=tactic.id, effectiveness_score=4)
+        ],
+    )
+    await async_db.commit()
+
+    logs = (await async_db.scalars(select(InteractionTacticLog))).all()
+    assert [(log.interaction_id, log.tactic_id) for log in logs] == [
+        (interaction.id, tactic.id)
+    ]
+    assert interaction.tactic_logs_json == [
+        {"tactic_id": str(tactic.id), "effectiveness_score": 4, "notes": None}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_pages_through_tied_datetimes(async_db):
+    user, contact = await _user_and_contact(async_db)
+    tied = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    newest = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    for i, when in enumerate([tied, tied, newest, tied, tied]):
+        await interaction_crud.create_with_tactics(
+            async_db,
+            obj_in=_interaction_in(contact, when, topic=f"#{i}"),
+            user_id=user.id,
+            tactic_logs_in=[],
+        )
+    await async_db.commit()
+    expected = await interaction_crud.get_multi_by_user_and_contact(
+        async_db, user_id=user.id, contact_id=contact.id
+    )
+
+    pages, after_dt, after_id = [], None, None
+    while True:
+        page = await interaction_crud.get_multi_by_user_and_contact(
+            async_db,
+            user_id=user.id,
+            contact_id=contact.id,
+            limit=2,
+            after_dt=after_dt,
+            after_id=after_id,
+        )
+        if not page:
+            break
+        pages.append(page)
+        after_dt, after_id = page[-1].interaction_datetime, page[-1].id
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [i.id for page in pages for i in page] == [i.id for i in expected]
+    assert expected[0].topic == "#2"
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_rejects_partial_cursor(async_db):
+    user, contact = await _user_and_contact(async_db)
+
+    with pytest.raises(ValueError):
+        await interaction_crud.get_multi_by_user_and_contact(
+            async_db,
+            user_id=user.id,
+            contact_id=contact.id,
+            after_dt=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import AliasChoices, Field
+
+from collaboration_bridge.crud.contact import contact_crud
+from collaboration_bridge.crud.interaction import interaction_crud
+from collaboration_bridge.models import (
+    Contact,
+    ContactLevel,
+    Interaction,
+    InteractionMedium,
+    User,
+)
+from collaboration_bridge.schemas.base import BaseSchema
+from collaboration_bridge.schemas.contact import ContactRead
+from collaboration_bridge.schemas.interaction import InteractionRead
+
+
+async def _user_and_contact(db):
+    user = User(email="owner@test.local", full_name="Owner", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    contact = Contact(
+        user_id=user.id, name="Dana", title="CTO", level=ContactLevel.MENTOR
+    )
+    db.add(contact)
+    await db.commit()
+    return user, contact
+
+
+def test_orm_columns_follow_string_validation_aliases():
+    assert "tactic_logs_json" in InteractionRead.orm_columns
+    assert "tactic_logs" not in InteractionRead.orm_columns
+
+
+def test_non_string_aliases_fall_back_to_field_name():
+    class Inbound(BaseSchema):
+        value: int = Field(validation_alias=AliasChoices("value", "val"))
+
+    assert Inbound.orm_columns == ("value",)
+
+
+@pytest.mark.asyncio
+async def test_from_orm_trusted_matches_validation_for_mapped_instance(async_db):
+    _, contact = await _user_and_contact(async_db)
+
+    trusted = ContactRead.from_orm_trusted(contact)
+
+    assert isinstance(trusted, ContactRead)
+    assert trusted == ContactRead.model_validate(contact)
+
+
+@pytest.mark.asyncio
+async def test_from_orm_trusted_reads_projected_rows(async_db):
+    user, contact = await _user_and_contact(async_db)
+
+    rows = await contact_crud.get_multi_by_user(
+        async_db, user_id=user.id, columns=ContactRead.orm_columns
+    )
+
+    assert [ContactRead.from_orm_trusted(row) for row in rows] == [
+        ContactRead.model_validate(contact)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_from_orm_trusted_parses_interaction_tactic_logs_from_row(async_db):
+    user, contact = await _user_and_contact(async_db)
+    async_db.add(
+        Interaction(
+            user_id=user.id,
+            contact_id=contact.id,
+            interaction_datetime=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            medium=InteractionMedium.IN_PERSON,
+            topic="1:1",
+            rapport_score_post=8,
+            tactic_logs_json=[
+                {
+                    "tactic_id": "00000000-0000-0000-0000-000000000001",
+                    "effectiveness_score": 5,
+                    "notes": None,
+                }
+            ],
+        )
+    )
+    await async_db.commit()
+
+    (row,) = await interaction_crud.get_multi_by_user_and_contact(
+        async_db,
+        user_id=user.id,
+        contact_id=contact.id,
+        columns=InteractionRead.orm_columns,
+    )
+    read = InteractionRead.from_orm_trusted(row)
+
+    assert read.topic == "1:1"
+    assert [log.effectiveness_score for log in read.tactic_logs] == [5]
+    assert str(read.tactic_logs[0].tactic_id) == "00000000-0000-0000-0000-000000000001"
@@ -0,0 +1,64 @@
+import time
+
+import jwt
+import pytest
+
+from collaboration_bridge.api import deps
+
+
+def _token(**claims):
+    return jwt.encode(claims, deps.JWT_SIGNING_KEY, algorithm=deps.JWT_ALGORITHMS[0])
+
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    """Give each test an empty verified-token cache."""
+    cache = {}
+    monkeypatch.setattr(deps, "_token_cache", cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_cached_until_exp(token_cache):
+    exp = int(time.time()) + 60
+    token = _token(sub="user@example.com", exp=exp)
+
+    assert await deps._decode_token_subject(token) == "user@example.com"
+    assert token_cache[token] == ("user@example.com", exp)
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_entry_is_evicted_and_reverified(token_cache):
+    exp = int(time.time()) + 60
+    token = _token(sub="user@example.com", exp=exp)
+    # A stale entry with a different subject proves the result came from verification
+    token_cache[token] = ("stale@example.com", time.time() - 1)
+
+    assert await deps._decode_token_subject(token) == "user@example.com"
+    assert token_cache[token] == ("user@example.com", exp)
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_rejected_after_eviction(token_cache):
+    token = _token(sub="user@example.com", exp=int(time.time()) - 10)
+    token_cache[token] = ("user@example.com", time.time() - 1)
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        await deps._decode_token_subject(token)
+    assert token not in token_cache
+
+
+@pytest.mark.asyncio
+async def test_token_without_sub_is_not_cached(token_cache):
+    token = _token(exp=int(time.time()) + 60)
+
+    assert await deps._decode_token_subject(token) is None
+    assert token not in token_cache
+
+
+@pytest.mark.asyncio
+async def test_token_without_exp_is_not_cached(token_cache):
+    token = _token(sub="user@example.com")
+
+    assert await deps._decode_token_subject(token) == "user@example.com"
+    assert token not in token_cache